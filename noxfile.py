@@ -20,7 +20,8 @@ def tests(session: nox.sessions.Session, sqlalchemy=None, pydantic=None):
         session.install(f'pydantic[email]=={pydantic}')
 
     # Test
-    session.run('pytest', '-vv', 'tests/', '--cov=sa2schema')
+    # Test modules are independent: run them in parallel, one module per worker
+    session.run('pytest', '-vv', 'tests/', '--cov=sa2schema', '-n', 'auto', '--dist=loadfile')
 
 
 @nox.session()
@@ -16,6 +16,7 @@ from .property import get_property_loads_attribute_names
 from .property import get_all_safely_loadable_properties
 
 from .sa_extract_info import sa_model_info
+from .sa_extract_info import sa_model_info_keys
 from .sa_extract_info import sa_model_attributes_by_type
 from .sa_extract_info import sa_model_primary_key_names
 from .sa_extract_info import sa_model_primary_key_info
@@ -7,7 +7,8 @@ Examples:
 
 from __future__ import annotations
 
-from typing import Set, Callable, Iterable
+from functools import lru_cache
+from typing import Callable, Iterable, FrozenSet
 
 import sa2schema
 from sa2schema.annotations import FilterT, FilterFunctionT, SAModelT
@@ -37,11 +38,11 @@ class PRIMARY_KEY(FieldFilterBase):
         exclude=PRIMARY_KEY()
         make_optional=PRIMARY_KEY()
     """
-    primary_key_names: Set[str]
+    primary_key_names: FrozenSet[str]
 
     def for_model(self, Model: SAModelT):
         super().for_model(Model)
-        self.primary_key_names = set(sa2schema.sa_model_primary_key_names(Model))
+        self.primary_key_names = _primary_key_names(Model)
 
     def __call__(self, name: str) -> bool:
         return name in self.primary_key_names
@@ -102,15 +103,16 @@ class BY_TYPE(FieldFilterBase):
     """
     def __init__(self, *, types: AttributeType, attrs: FilterT = True):
         self.types = types
-        self.exclude = NOT(attrs)
+        self.attrs = attrs
 
     def for_model(self, Model: SAModelT):
         super().for_model(Model)
-        self.model_info = sa2schema.sa_model_info(Model, types=self.types, exclude=self.exclude)
+        self.type_names = _attribute_names_by_type(Model, self.types)
+        self.attrs_filter = prepare_filter_function(self.attrs, Model)
 
     def __call__(self, name: str) -> bool:
-        # `model_info` already
-        return name in self.model_info
+        # Cheap set lookup first; `attrs` only gets to see attributes of the right type
+        return name in self.type_names and self.attrs_filter(name)
 
 
 class EITHER(FieldFilterBase):
@@ -201,3 +203,14 @@ def prepare_filter_function(filter: FilterT, Model: SAModelT) -> FilterFunctionT
     else:
         raise ValueError(filter)
 
+
+@lru_cache(typed=True)
+def _primary_key_names(Model: SAModelT) -> FrozenSet[str]:
+    """ Get the set of primary key names. Cached: filters are re-bound to the same models over and over again """
+    return frozenset(sa2schema.sa_model_primary_key_names(Model))
+
+
+@lru_cache(typed=True)
+def _attribute_names_by_type(Model: SAModelT, types: AttributeType) -> FrozenSet[str]:
+    """ Get the set of attribute names of the given `types`. Cached, same as above """
+    return frozenset(sa2schema.sa_model_info(Model, types=types))
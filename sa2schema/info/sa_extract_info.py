@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Mapping, Dict, Sequence, Tuple, Type
+from types import MappingProxyType
+from typing import Mapping, Dict, Sequence, Tuple, Type, FrozenSet
 
 from sqlalchemy.ext.associationproxy import AssociationProxy
 from sqlalchemy.orm import class_mapper, Mapper
@@ -20,6 +21,7 @@ def sa_model_info(Model: type, *,
     """ Extract information on every attribute of an SqlAlchemy model
 
     Note: it's really cheap to use this function because all the underlying information is cached.
+    The dict itself is new on every call, so it's fine to modify it.
 
     Args:
         Model: the model to extract the info about
@@ -29,6 +31,11 @@ def sa_model_info(Model: type, *,
     Returns:
         dict: Attribute names mapped to attribute info objects
     """
+    # A list of names is the most common `exclude`. It's hashable, so the result can be cached.
+    # Filter functions can't: they're often lambdas, and every one of them would pollute the cache.
+    if isinstance(exclude, (list, tuple, set, frozenset)):
+        return dict(_sa_model_info_excluding(Model, types, frozenset(exclude)))
+
     # Get the full model info
     model_info = _sa_model_info(Model, types)
 
@@ -43,6 +50,19 @@ def sa_model_info(Model: type, *,
     }
 
 
+@lru_cache(typed=True)
+def _sa_model_info_excluding(Model: type, types: AttributeType, exclude: FrozenSet[str]) -> Mapping[str, AttributeInfo]:
+    """ sa_model_info() with a list of names to exclude. Cached.
+
+    The result is read-only because it's cached. sa_model_info() gives every caller its own copy.
+    """
+    return MappingProxyType({
+        name: attr_info
+        for name, attr_info in _sa_model_info(Model, types).items()
+        if name not in exclude
+    })
+
+
 @lru_cache(typed=True)  # makes it really, really cheap to inspect models
 def _sa_model_info(Model: type, types: AttributeType) -> Mapping[str, AttributeInfo]:
     """ Get the full information about the model
@@ -50,6 +70,15 @@ def _sa_model_info(Model: type, types: AttributeType) -> Mapping[str, AttributeI
     This function gets a full, cachable, information about the model's `types` attributes, once.
     sa_model_info() can then filter it the way it likes, without polluting the cache.
     """
+    # The model is only walked once, with AttributeType.ALL.
+    # Every other `types` combination is picked from that walk: it's the same info, just fewer attributes.
+    if types != AttributeType.ALL:
+        return {
+            name: attr_info
+            for name, attr_info in _sa_model_info(Model, AttributeType.ALL).items()
+            if attr_info.attribute_type & types
+        }
+
     # Get a list of all available InfoClasses
     info_classes = [
         InfoClass
@@ -67,6 +96,36 @@ def _sa_model_info(Model: type, types: AttributeType) -> Mapping[str, AttributeI
     }
 
 
+def sa_model_info_keys(Model: type, *,
+                       types: AttributeType,
+                       exclude: FilterT = (),
+                       ) -> Sequence[str]:
+    """ Get the names of the attributes sa_model_info() would return
+
+    Use it when only the names are needed: no dict is built for the attribute info.
+
+    Args:
+        Model: the model to inspect
+        types: AttributeType types to inspect
+        exclude: the list of fields to ignore, or a filter(name) to exclude fields dynamically.
+    Returns:
+        tuple: Attribute names, in the order they were defined on the class
+    """
+    exclude = filter.prepare_filter_function(exclude, Model)
+    return tuple(
+        name
+        for name in _sa_model_info_keys(Model, types)
+        if not exclude(name)
+    )
+
+
+@lru_cache(typed=True)
+def _sa_model_info_keys(Model: type, types: AttributeType) -> Tuple[str, ...]:
+    """ Get the names of all `types` attributes of the model. Cached. """
+    # Picked from the same model walk as sa_model_info(), so the two always agree
+    return tuple(_sa_model_info(Model, types))
+
+
 @lru_cache(typed=True)
 def sa_model_attributes_by_type(Model: type) -> Mapping[Type[AttributeType], Mapping[str, AttributeInfo]]:
     """ Get model attributes neatly grouped into categories """
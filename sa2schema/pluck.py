@@ -17,10 +17,10 @@ Those dictionaries explicitly specify which attributes to load:
 import warnings
 import enum
 from functools import lru_cache
-from typing import Mapping, Union, Any, Callable, FrozenSet
+from typing import Mapping, Union, Any, Callable, FrozenSet, List
 
 from sqlalchemy.ext.declarative.api import DeclarativeMeta
-from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import Mapper, Session
 from sqlalchemy.orm.base import instance_dict, class_mapper
 
 from .annotations import SAInstanceT
@@ -144,6 +144,38 @@ def sa_pluck(instance: SAInstanceT, map: PluckMap, unloaded: Unloaded = Unloaded
     return ret
 
 
+def pluck_query(ssn: Session, Model: Union[type, DeclarativeMeta], map: PluckMap, unloaded: Unloaded = Unloaded.RAISE) -> List[dict]:
+    """ Load every instance of `Model` and pluck it according to `map`
+
+    When `map` only includes plain columns (not deferred), no instances are created at all:
+    the columns are selected directly, and dicts are made from the resulting rows.
+    This is several times faster than loading ORM instances just to pluck them.
+
+    If `map` refers to anything else (relationships, @property, nested JSON keys), every instance
+    is loaded and sa_pluck()ed. Because nothing is eager-loaded, you'll probably want `unloaded=Unloaded.LAZY` then.
+
+    Args:
+        ssn: the Session to query with
+        Model: the model to load
+        map: plucking map. See sa_pluck()
+        unloaded: what to do if an attribute is not loaded. Only used by the sa_pluck() fallback.
+
+    Example:
+        pluck_query(ssn, User, {'id': 1, 'login': 1})
+    """
+    # Keys to pluck
+    keys = [key for key, include in map.items() if include != 0]
+
+    # Fast path: only columns. Select them, skip the ORM
+    columns = column_attributes(Model)
+    if keys and all(key in columns and not isinstance(map[key], dict) for key in keys):
+        rows = ssn.query(*(getattr(Model, key) for key in keys))
+        return [dict(zip(keys, row)) for row in rows]
+
+    # Slow path: load instances, pluck them
+    return [sa_pluck(instance, map, unloaded) for instance in ssn.query(Model)]
+
+
 @lru_cache()
 def uselist_relationships(Model: Union[type, DeclarativeMeta]) -> Mapping[str, bool]:
     """ Inspect a model and return a map of {relationship name => uselist} """
@@ -163,6 +195,21 @@ def descriptor_attributes(Model: Union[type, DeclarativeMeta]) -> FrozenSet[str]
     return frozenset(sa_model_info(Model, types=AttributeType.ALL_DESCRIPTORS))
 
 
+@lru_cache()
+def column_attributes(Model: Union[type, DeclarativeMeta]) -> FrozenSet[str]:
+    """ Names of plain column attributes that are loaded together with the instance
+
+    These can be selected directly, without loading an instance, and give the same values.
+    Deferred columns are left out: an instance would have them unloaded, and `unloaded` decides what happens then.
+    """
+    mapper: Mapper = class_mapper(Model)
+    return frozenset(
+        name
+        for name in sa_model_info(Model, types=AttributeType.COLUMN)
+        if not mapper.column_attrs[name].deferred
+    )
+
+
 def pluck_dict(value: dict, map: PluckMap) -> dict:
     """ Pluck a dict
 
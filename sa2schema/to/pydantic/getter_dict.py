@@ -36,7 +36,7 @@ class SALoadedGetterDict(SAGetterDict):
     Be careful, though: if a field isn't loaded, this getter will return a None,
     which might not always make sense to your application.
     """
-    __slots__ = ('_loaded', '_safe_properties', '_excluded')
+    __slots__ = ('_dict', '_loaded', '_safe_properties', '_excluded')
 
     #: const: the value to return for unloaded attributes
     #: Note that the very same value will be used for collections as well.
@@ -44,6 +44,10 @@ class SALoadedGetterDict(SAGetterDict):
     #: see: pydantic.validate_model()
     EMPTY_VALUE = None
 
+    #: The instance's __dict__, where SqlAlchemy keeps loaded values.
+    #: Values found here are returned as is: no need to go through the InstrumentedAttribute descriptor
+    _dict: Mapping[str, Any]
+
     #: Cached set of loaded attributes.
     #: We cache it because it's not supposed to be modified while we're iterating the model
     _loaded: Set[str]
@@ -61,6 +65,7 @@ class SALoadedGetterDict(SAGetterDict):
 
         # Make a list of attributes the loading of which would lead to an unwanted DB query
         state: InstanceState = instance_state(self._obj)
+        self._dict = state.dict
         self._loaded = loaded_attribute_names(state)
         self._safe_properties = get_all_safely_loadable_properties(type(obj))
 
@@ -82,10 +87,13 @@ class SALoadedGetterDict(SAGetterDict):
     # Methods that only return attributes that are loaded; nothing more
 
     def __getitem__(self, key: str) -> Any:
+        # Loaded value. Read it directly.
+        if key in self._dict:
+            return self._dict[key]
         # Loaded attribute.
         # Or a @property , with all its attributes loaded.
         # Go ahead.
-        if key in self._loaded or (key in self._safe_properties and self._safe_properties[key] <= self._loaded):
+        elif key in self._loaded or (key in self._safe_properties and self._safe_properties[key] <= self._loaded):
             return super().__getitem__(key)
         # something unloaded. Do not touch; otherwise, we'll get numerous lazy loads
         else:
@@ -95,7 +103,9 @@ class SALoadedGetterDict(SAGetterDict):
     # same thing, but with a `default`
 
     def get(self, key: Any, default: Any = None) -> Any:
-        if key in self._loaded or (key in self._safe_properties and self._safe_properties[key] <= self._loaded):
+        if key in self._dict:
+            return self._dict[key]
+        elif key in self._loaded or (key in self._safe_properties and self._safe_properties[key] <= self._loaded):
             return super().get(key, default)
         else:
             self._excluded.add(key)
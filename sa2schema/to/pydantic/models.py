@@ -1,7 +1,7 @@
 """ Models: container for models that can relate to one another """
 
 from functools import partial
-from typing import Type, Optional, Mapping, Union, Iterable
+from typing import Type, Optional, Mapping, Union, Iterable, Tuple
 
 from pydantic import BaseModel
 
@@ -97,6 +97,19 @@ class Models:
         self._pydantic_names[model.__name__] = model
         return model
 
+    def build(self, *sa_models: Type[SAModelT]) -> Tuple[Type[PydanticModelT], ...]:
+        """ Add many models at once, then update forward references
+
+        Only works for models that need no per-model arguments.
+        For the rest, use sa_model() and update_forward_refs() yourself.
+
+        Example:
+            User, Article = ns.build(models.User, models.Article)
+        """
+        models = tuple(self.sa_model(Model) for Model in sa_models)
+        self.update_forward_refs()
+        return models
+
     def update_forward_refs(self):
         """ Update forward references so that models point to one another """
         for model in self._pydantic_names.values():
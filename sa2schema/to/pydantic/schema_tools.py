@@ -31,7 +31,7 @@ def derive_model(model: PydanticModelT,
     assert bool(include) != bool(exclude), 'Provide `include` or `exclude` but not both'
 
     # Prepare include list
-    include_fields = set(include) if include else (set(model.__fields__) - set(exclude))
+    include_fields = set(include) if include else (model.__fields__.keys() - exclude)
 
     # Fields
     fields = prepare_fields_for_create_model(
@@ -4,12 +4,18 @@ from .models import Base
 
 
 @pytest.fixture()
-def sqlite_session(Base=Base):
+def sa_base():
+    """ Declarative base whose tables `sqlite_session` creates. Override it in a module that has its own models """
+    return Base
+
+
+@pytest.fixture()
+def sqlite_session(sa_base):
     engine, Session = init_database(url='sqlite://')
 
-    if Base:
-        drop_all(engine, Base)
-        create_all(engine, Base)
+    if sa_base:
+        drop_all(engine, sa_base)
+        create_all(engine, sa_base)
 
     ssn = Session()
     try:
@@ -18,3 +24,13 @@ def sqlite_session(Base=Base):
         ssn.close()
 
     engine.dispose()
+
+
+def pytest_collection_modifyitems(items):
+    """ Mark every test that uses a database with `@pytest.mark.db`
+
+    This way, introspection-only tests can be run without any DB setup: pytest -m "not db"
+    """
+    for item in items:
+        if 'sqlite_session' in getattr(item, 'fixturenames', ()):
+            item.add_marker(pytest.mark.db)
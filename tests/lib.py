@@ -1,3 +1,9 @@
+from operator import attrgetter
+from typing import Mapping, Any, Dict, Type, FrozenSet, Callable
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
 from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.base import instance_state
 from sqlalchemy.orm.state import InstanceState
@@ -10,7 +16,51 @@ def sa_set_committed_state(obj: object, **committed_values):
     state.key = object()
 
     # Set every attribute in such a way that SA thinkg that's the way it looks in the DB
-    for k, v in committed_values.items():
-        set_committed_value(obj, k, v)
+    sa_set_committed_values(obj, committed_values)
 
     return obj
+
+
+def sa_set_committed_values(obj: object, committed_values: Mapping[str, Any]):
+    """ set_committed_value() for many attributes at once """
+    state: InstanceState = instance_state(obj)
+
+    # Scalar attributes: the same thing set_committed_value() does, but with one _commit() for all of them
+    scalar_values = {
+        k: v
+        for k, v in committed_values.items()
+        if not state.manager[k].impl.collection
+    }
+    state.dict.update(scalar_values)
+    state._commit(state.dict, list(scalar_values))
+
+    # Collections have to be initialized one by one
+    for k, v in committed_values.items():
+        if k not in scalar_values:
+            set_committed_value(obj, k, v)
+
+
+# Extract __fields__ from schema
+_schema_attrs_getter = attrgetter('alias', 'type_', 'required', 'default')  # 'allow_none'
+
+
+def schema_attrs(schema: Type[BaseModel]) -> Dict[str, dict]:
+    """ Extract field info from a Pydantic schema """
+    return {
+        alias: {'type': type_, 'required': required, 'default': default}
+        for alias, type_, required, default in map(_schema_attrs_getter, schema.__fields__.values())
+    }
+
+
+def field_names(schema: Type[BaseModel]) -> FrozenSet[str]:
+    """ Get field names of a Pydantic schema: same keys as schema_attrs(), without extracting the info """
+    return frozenset(field.alias for field in schema.__fields__.values())
+
+
+def schema_attrs_extract(schema: Type[BaseModel], extractor: Callable[[ModelField], dict]) -> Dict[str, dict]:
+    """ Walk a Pydantic model and extract info from every field with a callback """
+    field: ModelField
+    return {
+        field.alias: extractor(field)
+        for field in schema.__fields__.values()
+    }
@@ -1,6 +1,6 @@
 """ Models for testing """
 from enum import Enum
-from typing import Optional
+from typing import Optional, NamedTuple, Any
 
 import sqlalchemy as sa
 from sqlalchemy import select
@@ -21,14 +21,14 @@ class EnumType(Enum):
     b = 2
 
 
-class Point:
+class Point(NamedTuple):
     """ Point: a composite type using two fields """
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+    x: Any
+    y: Any
 
     def __composite_values__(self):
-        return self.x, self.y
+        # Already a tuple of column values
+        return self
 
 
 # A class with every conceivable attribute type
@@ -60,21 +60,9 @@ from sa2schema.to.pydantic import sa_model  # SqlAlchemy -> Pydantic converter
 
 
 @pytest.fixture()
-def sqlite_session(Base=Base):  # a shameful copy-paste from ./conftest.py because I can't give arguments to a fixture :(
-    from .db import init_database, drop_all, create_all
-    engine, Session = init_database(url='sqlite://')
-
-    if Base:
-        drop_all(engine, Base)
-        create_all(engine, Base)
-
-    ssn = Session()
-    try:
-        yield ssn
-    finally:
-        ssn.close()
-
-    engine.dispose()
+def sa_base():
+    """ Make `sqlite_session` from ./conftest.py create tables for the models of this module """
+    return Base
 
 
 def test_example_with_columns(sqlite_session: Session):
@@ -128,7 +116,7 @@ def test_example_with_columns(sqlite_session: Session):
     assert user.email == 'user@example.com'  # updated
 
 
-def test_example_with_columns(sqlite_session: Session):
+def test_example_with_relationships(sqlite_session: Session):
     class schemas:  # namespace
         from sa2schema.to.pydantic import Models, AttributeType
 
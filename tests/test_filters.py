@@ -8,27 +8,27 @@ from sa2schema.annotations import FilterT
 from . import models
 
 
-USER_PK = {'annotated_int'}
-USER_COLUMNS = {
+USER_PK = frozenset({'annotated_int'})
+USER_COLUMNS = frozenset({
     '_ignored',
     'annotated_int', 'int', 'enum',
     'optional', 'required', 'default',
     'documented', 'json_attr',
-}
-USER_PROPS = {
+})
+USER_PROPS = frozenset({
     'property_without_type', 'property_typed', 'property_documented', 'property_nullable', 'property_writable',
-}
-USER_HPROPS = {
+})
+USER_HPROPS = frozenset({
     'hybrid_property_typed', 'hybrid_property_writable', 'hybrid_method_attr',
-}
-USER_OTHER = {
+})
+USER_OTHER = frozenset({
     'expression', 'point', 'synonym',
-}
-USER_RELS = {
+})
+USER_RELS = frozenset({
     'articles_list', 'articles_set', 'articles_dict_attr', 'articles_dict_keyfun', 'article_titles', 'article_authors',
     'articles_q'
-}
-USER_ALL_FIELDS = USER_COLUMNS | USER_PROPS | USER_HPROPS | USER_OTHER | USER_RELS
+})
+USER_ALL_FIELDS = frozenset().union(USER_COLUMNS, USER_PROPS, USER_HPROPS, USER_OTHER, USER_RELS)
 
 
 @pytest.mark.parametrize(
@@ -6,35 +6,39 @@ import sa2schema as sa2
 from .lib import sa_set_committed_state
 
 
-def test_pluck():
-    """ Test sa_pluck() """
-    Base = declarative_base()
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = 'users'
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    meta = sa.Column(sa.JSON)
+    articles = sa.orm.relationship(lambda: Article, back_populates='author')
 
-    class User(Base):
-        __tablename__ = 'users'
-        id = sa.Column(sa.Integer, primary_key=True)
-        name = sa.Column(sa.String)
-        meta = sa.Column(sa.JSON)
-        articles = sa.orm.relationship(lambda: Article, back_populates='author')
+    unloaded = sa.Column(sa.String)
+    deferred = sa.orm.deferred(sa.Column(sa.String))
 
-        unloaded = sa.Column(sa.String)
+    @property
+    def prop(self):
+        return 'hey'
 
-        @property
-        def prop(self):
-            return 'hey'
+    assprox = sa.ext.associationproxy.association_proxy(
+        'articles',
+        'title'
+    )
 
-        assprox = sa.ext.associationproxy.association_proxy(
-            'articles',
-            'title'
-        )
 
-    class Article(Base):
-        __tablename__ = 'articles'
-        id = sa.Column(sa.Integer, primary_key=True)
-        title = sa.Column(sa.String)
-        author_id = sa.Column(sa.ForeignKey(User.id))
-        author = sa.orm.relationship(User, back_populates='articles')
+class Article(Base):
+    __tablename__ = 'articles'
+    id = sa.Column(sa.Integer, primary_key=True)
+    title = sa.Column(sa.String)
+    author_id = sa.Column(sa.ForeignKey(User.id))
+    author = sa.orm.relationship(User, back_populates='articles')
 
+
+def test_pluck():
+    """ Test sa_pluck() """
     u = sa_set_committed_state(User(), id=17, name='John', meta={'a': 1, 'b': {'c': 2, 'd': 3}}, articles=[
         sa_set_committed_state(Article(), id=100, author_id=17, title='Python'),
         sa_set_committed_state(Article(), id=101, author_id=17, title='Rust'),
@@ -94,3 +98,77 @@ def test_pluck():
 
     # Test: association proxy (because it's a descriptor)
     assert sa2.sa_pluck(u, {'assprox': 1}) == {'assprox': []}
+
+
+@pytest.fixture()
+def sa_base():
+    """ Make `sqlite_session` create tables for the models of this module """
+    return Base
+
+
+def test_pluck_query(sqlite_session):
+    """ Test pluck_query() """
+    ssn = sqlite_session
+    ssn.add(User(id=17, name='John', meta={'a': 1}, articles=[
+        Article(id=100, title='Python'),
+        Article(id=101, title='Rust'),
+    ]))
+    ssn.flush()
+    ssn.expunge_all()
+
+    # Columns only: rows are selected directly
+    assert sa2.pluck_query(ssn, Article, {'id': 1, 'title': 1}) == [
+        {'id': 100, 'title': 'Python'},
+        {'id': 101, 'title': 'Rust'},
+    ]
+    assert sa2.pluck_query(ssn, Article, {'id': 1, 'title': 0}) == [{'id': 100}, {'id': 101}]
+
+    # Same result as sa_pluck()
+    assert sa2.pluck_query(ssn, User, {'id': 1, 'meta': 1}) == [
+        sa2.sa_pluck(user, {'id': 1, 'meta': 1})
+        for user in ssn.query(User)
+    ]
+
+    # Anything else: instances are loaded and plucked
+    assert sa2.pluck_query(ssn, User, {'id': 1, 'prop': 1, 'meta': {'a': 1}}) == [{'id': 17, 'prop': 'hey', 'meta': {'a': 1}}]
+
+    with pytest.raises(AttributeError):
+        sa2.pluck_query(ssn, User, {'articles': {'id': 1}})  # not loaded
+
+    assert sa2.pluck_query(ssn, User, {'articles': {'id': 1}}, sa2.Unloaded.LAZY) == [{'articles': [{'id': 100}, {'id': 101}]}]
+
+
+@pytest.mark.parametrize(('Model', 'map'), [
+    # Fast path: plain columns
+    (Article, {'id': 1, 'title': 1}),
+    (User, {'id': 1, 'name': 1, 'meta': 1}),
+    # Slow path: a deferred column, a @property, a nested JSON map, a relationship
+    (User, {'id': 1, 'deferred': 1}),
+    (User, {'id': 1, 'prop': 1, 'meta': {'a': 1}}),
+    (User, {'id': 1, 'articles': {'id': 1, 'title': 1}}),
+    (Article, {'id': 1, 'author': {'name': 1}}),
+], ids=['columns', 'columns-json', 'deferred', 'property', 'relationship', 'relationship-many-to-one'])
+@pytest.mark.parametrize('unloaded', [sa2.Unloaded.NONE, sa2.Unloaded.LAZY, sa2.Unloaded.RAISE])
+def test_pluck_query_same_as_sa_pluck(sqlite_session, Model, map, unloaded):
+    """ Test that pluck_query() gives the same result as sa_pluck(), whichever path it takes """
+    ssn = sqlite_session
+    ssn.add(User(id=17, name='John', meta={'a': 1}, deferred='secret', articles=[
+        Article(id=100, title='Python'),
+        Article(id=101, title='Rust'),
+    ]))
+    ssn.flush()
+    ssn.expunge_all()
+
+    # Expected: sa_pluck() every freshly loaded instance
+    try:
+        expected = [sa2.sa_pluck(instance, map, unloaded) for instance in ssn.query(Model).order_by(Model.id)]
+    except AttributeError:
+        expected = AttributeError  # Unloaded.RAISE
+    ssn.expunge_all()
+
+    # pluck_query() does the same, or fails the same way
+    if expected is AttributeError:
+        with pytest.raises(AttributeError):
+            sa2.pluck_query(ssn, Model, map, unloaded)
+    else:
+        assert sa2.pluck_query(ssn, Model, map, unloaded) == expected
@@ -1,9 +1,13 @@
-from typing import List, Set, Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Set, Dict, Any, Mapping
+
+import pytest
 
 from sa2schema import sa_model_primary_key_names, sa_model_primary_key_info
 from sa2schema import sa_model_attributes_by_type
 from sa2schema import all_sqlalchemy_model_attribute_names
-from sa2schema import sa_model_info, sa_attribute_info, AttributeType
+from sa2schema import sa_model_info, sa_model_info_keys, sa_attribute_info, AttributeType
 from sa2schema.info.attribute import (
     NOT_PROVIDED,
     ColumnInfo,
@@ -14,6 +18,44 @@ from sa2schema.info.attribute import (
 from .models import *
 
 
+# Generic aliases used in the expected values below. Built once, at import time.
+_OPT_STR = Optional[str]
+_OPT_INT = Optional[int]
+_LIST_ARTICLE = List[Article]
+_SET_ARTICLE = Set[Article]
+_DICT_ANY_ARTICLE = Dict[Any, Article]
+_LIST_STR = List[str]
+_LIST_USER = List[User]
+_LIST_JTI_EMPLOYEE = List[JTI_Employee]
+
+
+@lru_cache(maxsize=1)
+def _build_ab_hierarchy():
+    """ Build a tiny polymorphic A/B hierarchy, once: mapping classes is expensive """
+    Base = declarative_base()
+
+    class A(Base):
+        __tablename__ = 'a'
+        id = sa.Column(sa.Integer, primary_key=True)
+        type = sa.Column(sa.String)
+
+        __mapper_args__ = {
+            'polymorphic_identity': 'a',
+            'polymorphic_on': type
+        }
+
+        @property
+        def number(self):
+            pass
+
+    class B(A):
+        __mapper_args__ = {
+            'polymorphic_identity': 'b',
+        }
+
+    return A, B
+
+
 def test_all_sqlalchemy_model_attribute_names():
     """ Test all_sqlalchemy_model_attribute_names() """
     assert sa_model_primary_key_names(User) == ('annotated_int',)
@@ -68,27 +110,7 @@ def test_all_sqlalchemy_model_attribute_names():
         'd3',
     )
     # Check inherited properties
-
-    Base = declarative_base()
-
-    class A(Base):
-        __tablename__ = 'a'
-        id = sa.Column(sa.Integer, primary_key=True)
-        type = sa.Column(sa.String)
-
-        __mapper_args__ = {
-            'polymorphic_identity': 'a',
-            'polymorphic_on': type
-        }
-
-        @property
-        def number(self):
-            pass
-
-    class B(A):
-        __mapper_args__ = {
-            'polymorphic_identity': 'b',
-        }
+    A, B = _build_ab_hierarchy()
 
     assert all_sqlalchemy_model_attribute_names(B) == (
         'id', 'type',
@@ -97,13 +119,334 @@ def test_all_sqlalchemy_model_attribute_names():
     )
 
 
-def test_sa_model_info_extraction__User():
-    """ Test sa_model_info(User) """
-    generated_fields = sa_model_info(User, types=AttributeType.ALL, exclude=())
-    expected_fields = {
-        '_ignored': ColumnInfo(  # not ignored in sa_model_info() ; ignored in sa_model()
+# Expected sa_model_info() results.
+# Built once, at import time, and shared by the tests below. Don't modify them.
+
+# SqlAlchemy descriptors referenced by the expected User info
+_HYBRID_METHOD_ATTR = User.__mapper__.all_orm_descriptors['hybrid_method_attr']
+_ARTICLES_DICT_ATTR_CLS = User.articles_dict_attr.property.collection_class  # some weird class
+_ARTICLES_DICT_KEYFUN_CLS = User.articles_dict_keyfun.property.collection_class  # some weird callable
+
+
+_EXPECTED_USER_FIELDS = {
+    '_ignored': ColumnInfo(  # not ignored in sa_model_info() ; ignored in sa_model()
+        attribute_type=AttributeType.COLUMN,
+        attribute=User._ignored,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=str,
+        default=None,
+        default_factory=None,
+        doc=None
+    ),
+    'annotated_int': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.annotated_int,
+        primary_key=True,
+        foreign_key=False,
+        nullable=False,
+        readable=True,
+        writable=True,
+        value_type=str,  # annotations are ignored here
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None
+    ),
+    'int': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.int,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=int,  # type is here
+        default=None,  # nullable columns always have this default
+        default_factory=None,
+        doc=None
+    ),
+    'enum': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.enum,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=EnumType,  # type is here
+        default=None,  # nullable column
+        default_factory=None,
+        doc=None
+    ),
+    'optional': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.optional,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,  # optional
+        readable=True,
+        writable=True,
+        value_type=str,  # type is not wrapped in Optional[]
+        default=None,  # nullable column
+        default_factory=None,
+        doc=None
+    ),
+    'required': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.required,
+        primary_key=False,
+        foreign_key=False,
+        nullable=False,  # required
+        readable=True,
+        writable=True,
+        value_type=str,
+        default=NOT_PROVIDED,  # non-nullable columns get this
+        default_factory=None,
+        doc=None
+    ),
+    'default': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.default,
+        primary_key=False,
+        foreign_key=False,
+        nullable=False,  # not nullable
+        readable=True,
+        writable=True,
+        value_type=str,
+        default='value',  # default value
+        default_factory=None,
+        doc=None
+    ),
+    'documented': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.documented,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=str,
+        default=None,  # nullable column
+        default_factory=None,
+        doc='Some descriptive text'  # doc=text
+    ),
+    'json_attr': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=User.json_attr,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        # JSON defaults to dict in SqlAlchemy
+        value_type=dict,
+        default=None,  # nullable column
+        default_factory=None,
+        doc=None
+    ),
+    'property_without_type': PropertyInfo(
+        attribute_type=AttributeType.PROPERTY_R,  # no setter
+        attribute=User.property_without_type,
+        nullable=True,  # no type. No idea. May be null as well.
+        readable=True,
+        writable=False,  # no setter
+        loads_attributes=None,
+        value_type=Any,  # no idea
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None
+    ),
+    'property_typed': PropertyInfo(
+        attribute_type=AttributeType.PROPERTY_R,  # no setter
+        attribute=User.property_typed,
+        nullable=False,  # return value is not Optional[]
+        readable=True,
+        writable=False,  # no setter
+        loads_attributes=None,
+        value_type=str,
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None
+    ),
+    'property_documented': PropertyInfo(
+        attribute_type=AttributeType.PROPERTY_R,  # no setter
+        attribute=User.property_documented,
+        nullable=True,  # no return value. May be null.
+        readable=True,
+        writable=False,  # no setter
+        loads_attributes={'documented'},  # read from @loads_attributes()
+        value_type=Any,  # no return value
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=' Documented property '
+    ),
+    'property_nullable': PropertyInfo(
+        attribute_type=AttributeType.PROPERTY_R,  # no setter
+        attribute=User.property_nullable,
+        nullable=True,  # explicitly Optional[]
+        readable=True,
+        writable=False,  # no setter
+        loads_attributes=None,
+        value_type=str,  # unwrapped
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'property_writable': PropertyInfo(
+        attribute_type=AttributeType.PROPERTY_RW,  # setter provided
+        attribute=User.property_writable,
+        nullable=False,  # no Optional[]
+        readable=True,
+        writable=True,  # with setter
+        loads_attributes=None,
+        value_type=str,  # type
+        default='default',  # from setter's argument
+        default_factory=None,
+        doc=None,
+    ),
+    'hybrid_property_typed': HybridPropertyInfo(
+        attribute_type=AttributeType.HYBRID_PROPERTY_R,  # no setter
+        attribute=User.hybrid_property_typed.descriptor,
+        nullable=False,  # no Optional[]
+        readable=True,
+        writable=False,  # no setter
+        loads_attributes=None,
+        value_type=str,  # type
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'hybrid_property_writable': HybridPropertyInfo(
+        attribute_type=AttributeType.HYBRID_PROPERTY_RW,  # setter
+        attribute=User.hybrid_property_writable.descriptor,
+        nullable=False,  # no Optional[]
+        readable=True,
+        writable=True,  # setter
+        loads_attributes=None,
+        value_type=str,  # type
+        default='default',  # from setter's argument
+        default_factory=None,
+        doc=None,
+    ),
+    'hybrid_method_attr': HybridMethodInfo(
+        attribute_type=AttributeType.HYBRID_METHOD,
+        attribute=_HYBRID_METHOD_ATTR,
+        nullable=True,
+        readable=True,
+        writable=False,
+        value_type=Any,  # no return annotation
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'expression': ColumnExpressionInfo(
+        attribute_type=AttributeType.EXPRESSION,
+        attribute=User.expression,
+        nullable=True,
+        readable=True,
+        writable=False,
+        value_type=int,  # sqlalchemy knows!
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'point': CompositeInfo(
+        attribute_type=AttributeType.COMPOSITE,
+        attribute=User.point,
+        nullable=False,  # composites aren't nullable
+        readable=True,
+        writable=True,  # it's wriable
+        value_type=Point,  # composite type
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'synonym': CompositeInfo(
+        # COMPLETELY copies the 'point' it points to!
+        attribute_type=AttributeType.COMPOSITE,
+        attribute=User.synonym,
+        nullable=False,
+        readable=True,
+        writable=True,
+        value_type=Point,
+        default=NOT_PROVIDED,
+        default_factory=None,
+        doc=None,
+    ),
+    'articles_list': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=User.articles_list,
+        nullable=False,  # "no" when `uselist`
+        readable=True,
+        writable=True,
+        value_type=_LIST_ARTICLE,  # target model, collection
+        target_model=Article,
+        uselist=True,
+        collection_class=list,
+        default=NOT_PROVIDED,
+        default_factory=list,
+        doc=None,
+    ),
+    'articles_set': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=User.articles_set,
+        nullable=False,  # "no" when `uselist`
+        readable=True,
+        writable=False,  # `viewonly` is set
+        value_type=_SET_ARTICLE,  # target model, collection
+        target_model=Article,
+        uselist=True,
+        collection_class=set,
+        default=NOT_PROVIDED,
+        default_factory=set,
+        doc=None,
+    ),
+    'articles_dict_attr': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=User.articles_dict_attr,
+        nullable=False,  # "no" when `uselist`
+        readable=True,
+        writable=True,
+        value_type=_DICT_ANY_ARTICLE,  # guessed the type!
+        target_model=Article,
+        uselist=True,
+        collection_class=_ARTICLES_DICT_ATTR_CLS,
+        default=NOT_PROVIDED,
+        default_factory=dict,
+        doc=None,
+    ),
+    'articles_dict_keyfun': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=User.articles_dict_keyfun,
+        nullable=False,  # "no" when `uselist`
+        readable=True,
+        writable=True,
+        value_type=_DICT_ANY_ARTICLE,  # guessed the type!
+        target_model=Article,
+        uselist=True,
+        collection_class=_ARTICLES_DICT_KEYFUN_CLS,
+        default=NOT_PROVIDED,
+        default_factory=dict,
+        doc=None,
+    ),
+    'article_titles': AssociationProxyInfo(
+        attribute_type=AttributeType.ASSOCIATION_PROXY,
+        attribute=User.article_titles,
+        nullable=False,  # "yes" when `scalar`
+        readable=True,
+        writable=False,  # always false
+        value_type=_LIST_STR,  # dict: target column's type, target model
+        target_model=Article,
+        collection_class=list,
+        default=NOT_PROVIDED,
+        default_factory=list,
+        doc=None,
+        target_attr_info=ColumnInfo(
             attribute_type=AttributeType.COLUMN,
-            attribute=User._ignored,
+            attribute=Article.title,
             primary_key=False,
             foreign_key=False,
             nullable=True,
@@ -114,672 +457,381 @@ def test_sa_model_info_extraction__User():
             default_factory=None,
             doc=None
         ),
-        'annotated_int': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.annotated_int,
-            primary_key=True,
-            foreign_key=False,
-            nullable=False,
-            readable=True,
-            writable=True,
-            value_type=str,  # annotations are ignored here
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None
-        ),
-        'int': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.int,
-            primary_key=False,
-            foreign_key=False,
+    ),
+    'article_authors': AssociationProxyInfo(
+        attribute_type=AttributeType.ASSOCIATION_PROXY,
+        attribute=User.article_authors,
+        nullable=False,
+        readable=True,
+        writable=False,  # always false
+        value_type=_LIST_USER,  # dict: target column's type, target model
+        target_model=Article,
+        collection_class=list,
+        default=NOT_PROVIDED,
+        default_factory=list,
+        doc=None,
+        target_attr_info=RelationshipInfo(
+            attribute_type=AttributeType.RELATIONSHIP,
+            attribute=Article.user,
             nullable=True,
             readable=True,
             writable=True,
-            value_type=int,  # type is here
-            default=None,  # nullable columns always have this default
+            value_type=User,
+            target_model=User,
+            uselist=False,
+            collection_class=None,
+            default=None,
             default_factory=None,
-            doc=None
+            doc=None,
         ),
-        'enum': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.enum,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,
-            readable=True,
-            writable=True,
-            value_type=EnumType,  # type is here
-            default=None,  # nullable column
+    ),
+    'articles_q': DynamicLoaderInfo(
+        attribute_type=AttributeType.DYNAMIC_LOADER,
+        attribute=User.articles_q,
+        nullable=False,  # "no" when `uselist`
+        readable=True,
+        writable=True,  # yes it is!
+        value_type=_LIST_ARTICLE,  # target model, collection
+        target_model=Article,
+        uselist=True,
+        collection_class=list,
+        default=NOT_PROVIDED,
+        default_factory=list,
+        doc=None,
+    ),
+}
+
+
+@pytest.fixture(scope='session')
+def user_info_all():
+    """ sa_model_info(User) with all attributes, computed once """
+    return sa_model_info(User, types=AttributeType.ALL, exclude=())
+
+
+_EXPECTED_USER_FINAL_TYPES = {
+    '_ignored': _OPT_STR,
+    'annotated_int': str,
+    'int': _OPT_INT,
+    'enum': Optional[EnumType],
+    'optional': _OPT_STR,
+    'required': str,
+    'default': str,
+    'documented': _OPT_STR,
+    'json_attr': Optional[dict],
+    'property_without_type': Any,  # note: `Any` is not wrapped into Optional[]
+    'property_typed': str,
+    'property_documented': Any,  # note: `Any` is not wrapped into Optional[]
+    'property_nullable': _OPT_STR,
+    'property_writable': str,
+    'hybrid_property_typed': str,
+    'hybrid_property_writable': str,
+    'hybrid_method_attr': Any,
+    'expression': _OPT_INT,
+    'point': Point,
+    'synonym': Point,
+    'articles_list': _LIST_ARTICLE,
+    'articles_set': _SET_ARTICLE,
+    'articles_dict_attr': _DICT_ANY_ARTICLE,
+    'articles_dict_keyfun': _DICT_ANY_ARTICLE,
+    'article_titles': _LIST_STR,
+    'article_authors': _LIST_USER,
+    'articles_q': _LIST_ARTICLE,
+}
+
+
+@pytest.mark.parametrize('name', list(_EXPECTED_USER_FIELDS))
+def test_sa_model_info_extraction__User_attribute(name, user_info_all):
+    """ Test sa_model_info(User): every attribute separately, so one failure doesn't hide the others """
+    assert user_info_all[name] == _EXPECTED_USER_FIELDS[name]
+
+
+def test_sa_model_info_extraction__User(user_info_all):
+    """ Test sa_model_info(User): field names, final values, primary key, attributes by type """
+    generated_fields = user_info_all
+    expected_fields = _EXPECTED_USER_FIELDS
+
+    # Every field is compared by test_sa_model_info_extraction__User_attribute(); check that there are no others
+    assert generated_fields.keys() == expected_fields.keys()
+
+    # Compare final values
+    assert {
+        name: attr.final_value_type
+        for name, attr in generated_fields.items()
+    } == _EXPECTED_USER_FINAL_TYPES
+
+    # Test primary key
+    assert sa_model_primary_key_info(User) == {'annotated_int': expected_fields['annotated_int']}
+
+    # Test sa_attribute_info()
+    _assert_fields_equal({
+        attribute_name: sa_attribute_info(User, attribute_name)
+        for attribute_name in expected_fields
+    }, expected_fields)
+
+    # Test sa_model_attributes_by_type()
+    attrs_by_type = sa_model_attributes_by_type(User)
+
+    assert set(attrs_by_type) == {
+        type(attr_info) for attr_info in expected_fields.values()
+    }
+
+    expected_by_type = defaultdict(dict)
+    for attr_name, attr_info in expected_fields.items():
+        # don't use isinstance() because DynamicLoader will be part of relationship then
+        expected_by_type[type(attr_info)][attr_name] = attr_info
+    assert attrs_by_type == expected_by_type
+
+
+_EXPECTED_ARTICLE_FIELDS = {
+    'id': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=Article.id,
+        primary_key=True,
+        foreign_key=False,
+        nullable=False,  # primary key
+        readable=True,
+        writable=True,
+        value_type=int,
+        default=NOT_PROVIDED,  # because not nullable
+        default_factory=None,
+        doc=None
+    ),
+    'user_id': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=Article.user_id,
+        primary_key=False,
+        foreign_key=True,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=str,  # Note: gotten through a ForeinKey()
+        default=None,  # because nullable
+        default_factory=None,
+        doc=None
+    ),
+    'title': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=Article.title,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=str,
+        default=None,  # because nullable
+        default_factory=None,
+        doc=None
+    ),
+    'user': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=Article.user,
+        nullable=True,  # singular
+        readable=True,
+        writable=True,
+        value_type=User,  # not wrapped in any collections
+        target_model=User,
+        uselist=False,
+        collection_class=None,
+        default=None,  # because nullable
+        default_factory=None,
+        doc=None
+    ),
+}
+
+
+_EXPECTED_ARTICLE_FINAL_TYPES = {
+    'id': int,
+    'user_id': _OPT_STR,
+    'title': _OPT_STR,
+    'user': Optional[User],
+}
+
+
+def test_sa_model_info_extraction__Article():
+    """ Test sa_model_info(Article): final values """
+    generated_fields = sa_model_info(Article, types=AttributeType.ALL, exclude=())
+
+    # Compare final values
+    assert {
+        name: attr.final_value_type
+        for name, attr in generated_fields.items()
+    } == _EXPECTED_ARTICLE_FINAL_TYPES
+
+
+_NUMBER_COMMON_FIELD_INFO = dict(
+    attribute_type=AttributeType.COLUMN,
+    primary_key=False,
+    foreign_key=False,
+    readable=True,
+    writable=True,
+    value_type=int,
+    doc=None
+)
+
+_EXPECTED_NUMBER_FIELDS = {
+    'id': ColumnInfo(**{
+        **_NUMBER_COMMON_FIELD_INFO,
+        **dict(
+            attribute=Number.id,
+            primary_key=True,
+            nullable=False,  # primary key
+            default=NOT_PROVIDED,  # because not nullable
             default_factory=None,
-            doc=None
         ),
-        'optional': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.optional,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,  # optional
-            readable=True,
-            writable=True,
-            value_type=str,  # type is not wrapped in Optional[]
-            default=None,  # nullable column
-            default_factory=None,
-            doc=None
-        ),
-        'required': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.required,
-            primary_key=False,
-            foreign_key=False,
-            nullable=False,  # required
-            readable=True,
-            writable=True,
-            value_type=str,
-            default=NOT_PROVIDED,  # non-nullable columns get this
-            default_factory=None,
-            doc=None
-        ),
-        'default': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.default,
-            primary_key=False,
-            foreign_key=False,
-            nullable=False,  # not nullable
-            readable=True,
-            writable=True,
-            value_type=str,
-            default='value',  # default value
-            default_factory=None,
-            doc=None
-        ),
-        'documented': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.documented,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,
-            readable=True,
-            writable=True,
-            value_type=str,
-            default=None,  # nullable column
-            default_factory=None,
-            doc='Some descriptive text'  # doc=text
-        ),
-        'json_attr': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=User.json_attr,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,
-            readable=True,
-            writable=True,
-            # JSON defaults to dict in SqlAlchemy
-            value_type=dict,
-            default=None,  # nullable column
-            default_factory=None,
-            doc=None
-        ),
-        'property_without_type': PropertyInfo(
-            attribute_type=AttributeType.PROPERTY_R,  # no setter
-            attribute=User.property_without_type,
-            nullable=True,  # no type. No idea. May be null as well.
-            readable=True,
-            writable=False,  # no setter
-            loads_attributes=None,
-            value_type=Any,  # no idea
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None
-        ),
-        'property_typed': PropertyInfo(
-            attribute_type=AttributeType.PROPERTY_R,  # no setter
-            attribute=User.property_typed,
-            nullable=False,  # return value is not Optional[]
-            readable=True,
-            writable=False,  # no setter
-            loads_attributes=None,
-            value_type=str,
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None
-        ),
-        'property_documented': PropertyInfo(
-            attribute_type=AttributeType.PROPERTY_R,  # no setter
-            attribute=User.property_documented,
-            nullable=True,  # no return value. May be null.
-            readable=True,
-            writable=False,  # no setter
-            loads_attributes={'documented'},  # read from @loads_attributes()
-            value_type=Any,  # no return value
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=' Documented property '
-        ),
-        'property_nullable': PropertyInfo(
-            attribute_type=AttributeType.PROPERTY_R,  # no setter
-            attribute=User.property_nullable,
-            nullable=True,  # explicitly Optional[]
-            readable=True,
-            writable=False,  # no setter
-            loads_attributes=None,
-            value_type=str,  # unwrapped
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'property_writable': PropertyInfo(
-            attribute_type=AttributeType.PROPERTY_RW,  # setter provided
-            attribute=User.property_writable,
-            nullable=False,  # no Optional[]
-            readable=True,
-            writable=True,  # with setter
-            loads_attributes=None,
-            value_type=str,  # type
-            default='default',  # from setter's argument
-            default_factory=None,
-            doc=None,
-        ),
-        'hybrid_property_typed': HybridPropertyInfo(
-            attribute_type=AttributeType.HYBRID_PROPERTY_R,  # no setter
-            attribute=User.hybrid_property_typed.descriptor,
-            nullable=False,  # no Optional[]
-            readable=True,
-            writable=False,  # no setter
-            loads_attributes=None,
-            value_type=str,  # type
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'hybrid_property_writable': HybridPropertyInfo(
-            attribute_type=AttributeType.HYBRID_PROPERTY_RW,  # setter
-            attribute=User.hybrid_property_writable.descriptor,
-            nullable=False,  # no Optional[]
-            readable=True,
-            writable=True,  # setter
-            loads_attributes=None,
-            value_type=str,  # type
-            default='default',  # from setter's argument
-            default_factory=None,
-            doc=None,
-        ),
-        'hybrid_method_attr': HybridMethodInfo(
-            attribute_type=AttributeType.HYBRID_METHOD,
-            attribute=User.__mapper__.all_orm_descriptors.hybrid_method_attr,
-            nullable=True,
-            readable=True,
-            writable=False,
-            value_type=Any,  # no return annotation
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'expression': ColumnExpressionInfo(
-            attribute_type=AttributeType.EXPRESSION,
-            attribute=User.expression,
-            nullable=True,
-            readable=True,
-            writable=False,
-            value_type=int,  # sqlalchemy knows!
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'point': CompositeInfo(
-            attribute_type=AttributeType.COMPOSITE,
-            attribute=User.point,
-            nullable=False,  # composites aren't nullable
-            readable=True,
-            writable=True,  # it's wriable
-            value_type=Point,  # composite type
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'synonym': CompositeInfo(
-            # COMPLETELY copies the 'point' it points to!
-            attribute_type=AttributeType.COMPOSITE,
-            attribute=User.synonym,
-            nullable=False,
-            readable=True,
-            writable=True,
-            value_type=Point,
-            default=NOT_PROVIDED,
-            default_factory=None,
-            doc=None,
-        ),
-        'articles_list': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=User.articles_list,
-            nullable=False,  # "no" when `uselist`
-            readable=True,
-            writable=True,
-            value_type=List[Article],  # target model, collection
-            target_model=Article,
-            uselist=True,
-            collection_class=list,
-            default=NOT_PROVIDED,
-            default_factory=list,
-            doc=None,
-        ),
-        'articles_set': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=User.articles_set,
-            nullable=False,  # "no" when `uselist`
-            readable=True,
-            writable=False,  # `viewonly` is set
-            value_type=Set[Article],  # target model, collection
-            target_model=Article,
-            uselist=True,
-            collection_class=set,
-            default=NOT_PROVIDED,
-            default_factory=set,
-            doc=None,
-        ),
-        'articles_dict_attr': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=User.articles_dict_attr,
-            nullable=False,  # "no" when `uselist`
-            readable=True,
-            writable=True,
-            value_type=Dict[Any, Article],  # guessed the type!
-            target_model=Article,
-            uselist=True,
-            collection_class=User.articles_dict_attr.property.collection_class,  # some weird class
-            default=NOT_PROVIDED,
-            default_factory=dict,
-            doc=None,
-        ),
-        'articles_dict_keyfun': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=User.articles_dict_keyfun,
-            nullable=False,  # "no" when `uselist`
-            readable=True,
-            writable=True,
-            value_type=Dict[Any, Article],  # guessed the type!
-            target_model=Article,
-            uselist=True,
-            collection_class=User.articles_dict_keyfun.property.collection_class,  # some weird callable
-            default=NOT_PROVIDED,
-            default_factory=dict,
-            doc=None,
-        ),
-        'article_titles': AssociationProxyInfo(
-            attribute_type=AttributeType.ASSOCIATION_PROXY,
-            attribute=User.article_titles,
-            nullable=False,  # "yes" when `scalar`
-            readable=True,
-            writable=False,  # always false
-            value_type=List[str],  # dict: target column's type, target model
-            target_model=Article,
-            collection_class=list,
-            default=NOT_PROVIDED,
-            default_factory=list,
-            doc=None,
-            target_attr_info=ColumnInfo(
-                attribute_type=AttributeType.COLUMN,
-                attribute=Article.title,
-                primary_key=False,
-                foreign_key=False,
-                nullable=True,
-                readable=True,
-                writable=True,
-                value_type=str,
-                default=None,
-                default_factory=None,
-                doc=None
-            ),
-        ),
-        'article_authors': AssociationProxyInfo(
-            attribute_type=AttributeType.ASSOCIATION_PROXY,
-            attribute=User.article_authors,
-            nullable=False,
-            readable=True,
-            writable=False,  # always false
-            value_type=List[User],  # dict: target column's type, target model
-            target_model=Article,
-            collection_class=list,
-            default=NOT_PROVIDED,
-            default_factory=list,
-            doc=None,
-            target_attr_info=RelationshipInfo(
-                attribute_type=AttributeType.RELATIONSHIP,
-                attribute=Article.user,
-                nullable=True,
-                readable=True,
-                writable=True,
-                value_type=User,
-                target_model=User,
-                uselist=False,
-                collection_class=None,
-                default=None,
-                default_factory=None,
-                doc=None,
-            ),
-        ),
-        'articles_q': DynamicLoaderInfo(
-            attribute_type=AttributeType.DYNAMIC_LOADER,
-            attribute=User.articles_q,
-            nullable=False,  # "no" when `uselist`
-            readable=True,
-            writable=True,  # yes it is!
-            value_type=List[Article],  # target model, collection
-            target_model=Article,
-            uselist=True,
-            collection_class=list,
-            default=NOT_PROVIDED,
-            default_factory=list,
-            doc=None,
-        ),
-    }
-
-    # Compare keys first
-    assert set(generated_fields) == set(expected_fields)
-
-    # Compare values
-    if False:
-        assert generated_fields == expected_fields
-    # Compare values one by one
-    # May be easier to debug when the difference is too large
-    else:
-        for k in generated_fields:
-            assert (k, generated_fields[k]) == (k, expected_fields[k])
-
-    # Compare final values
-    assert {
-        name: attr.final_value_type
-        for name, attr in generated_fields.items()
-    } == {
-        '_ignored': Optional[str],
-        'annotated_int': str,
-        'int': Optional[int],
-        'enum': Optional[EnumType],
-        'optional': Optional[str],
-        'required': str,
-        'default': str,
-        'documented': Optional[str],
-        'json_attr': Optional[dict],
-        'property_without_type': Any,  # note: `Any` is not wrapped into Optional[]
-        'property_typed': str,
-        'property_documented': Any,  # note: `Any` is not wrapped into Optional[]
-        'property_nullable': Optional[str],
-        'property_writable': str,
-        'hybrid_property_typed': str,
-        'hybrid_property_writable': str,
-        'hybrid_method_attr': Any,
-        'expression': Optional[int],
-        'point': Point,
-        'synonym': Point,
-        'articles_list': List[Article],
-        'articles_set': Set[Article],
-        'articles_dict_attr': Dict[Any, Article],
-        'articles_dict_keyfun': Dict[Any, Article],
-        'article_titles': List[str],
-        'article_authors': List[User],
-        'articles_q': List[Article],
-    }
-
-    # Test sa_attribute_info()
-    for attribute_name, expected_attribute_info in expected_fields.items():
-        assert sa_attribute_info(User, attribute_name) == expected_attribute_info
-
-    # Test primary key
-    assert sa_model_primary_key_info(User) == {'annotated_int': expected_fields['annotated_int']}
-
-    # Test sa_model_attributes_by_type()
-    attrs_by_type = sa_model_attributes_by_type(User)
-
-    assert set(attrs_by_type) == {
-        type(attr_info) for attr_info in expected_fields.values()
-    }
-
-    assert attrs_by_type == {
-        AttributeInfoType: {
-            attr_name: attr_info
-            for attr_name, attr_info in expected_fields.items()
-            if type(attr_info) == AttributeInfoType  # don't use isinstance() because DynamicLoader will be part of relationship then
-        }
-        for AttributeInfoType in set(attrs_by_type)
-    }
-
-
-def test_sa_model_info_extractin__Article():
-    """ Test sa_model_info(Article) """
-    generated_fields = sa_model_info(Article, types=AttributeType.ALL, exclude=())
-    expected_fields = {
-        'id': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=Article.id,
-            primary_key=True,
-            foreign_key=False,
-            nullable=False,  # primary key
-            readable=True,
-            writable=True,
-            value_type=int,
-            default=NOT_PROVIDED,  # because not nullable
-            default_factory=None,
-            doc=None
-        ),
-        'user_id': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=Article.user_id,
-            primary_key=False,
-            foreign_key=True,
-            nullable=True,
-            readable=True,
-            writable=True,
-            value_type=str,  # Note: gotten through a ForeinKey()
-            default=None,  # because nullable
-            default_factory=None,
-            doc=None
-        ),
-        'title': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=Article.title,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,
-            readable=True,
-            writable=True,
-            value_type=str,
-            default=None,  # because nullable
-            default_factory=None,
-            doc=None
-        ),
-        'user': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=Article.user,
-            nullable=True,  # singular
-            readable=True,
-            writable=True,
-            value_type=User,  # not wrapped in any collections
-            target_model=User,
-            uselist=False,
-            collection_class=None,
-            default=None,  # because nullable
-            default_factory=None,
-            doc=None
-        ),
-    }
-
-    assert generated_fields == expected_fields
-
-    # Compare final values
-    assert {
-        name: attr.final_value_type
-        for name, attr in generated_fields.items()
-    } == {
-        'id': int,
-        'user_id': Optional[str],
-        'title': Optional[str],
-        'user': Optional[User],
-    }
-
-    # Test primary key
-    assert sa_model_primary_key_info(Article) == {'id': expected_fields['id']}
+    }),
+    'n': ColumnInfo(
+        attribute=Number.n,
+        nullable=True,  # nullable
+        default=None,  # because nullable
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'nd1': ColumnInfo(
+        attribute=Number.nd1,
+        nullable=True,
+        default=100,
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'nd2': ColumnInfo(
+        attribute=Number.nd2,
+        nullable=True,
+        default=NOT_PROVIDED,  # we don't work with callables
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'nd3': ColumnInfo(
+        attribute=Number.nd3,
+        nullable=True,
+        default=NOT_PROVIDED,  # we don't work with expressions
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'd1': ColumnInfo(
+        attribute=Number.d1,
+        nullable=False,
+        default=100,
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'd2': ColumnInfo(
+        attribute=Number.d2,
+        nullable=False,
+        default=NOT_PROVIDED,  # we don't work with callables
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+    'd3': ColumnInfo(
+        attribute=Number.d3,
+        nullable=False,
+        default=NOT_PROVIDED,  # we don't work with expressions
+        default_factory=None,
+        **_NUMBER_COMMON_FIELD_INFO
+    ),
+}
 
 
-def test_sa_model_info_extractin__Number():
-    """ Test sa_model_info(Number): test for defaults """
-    common_field_info = dict(
+_EXPECTED_JTI_COMPANY_FIELDS = {
+    'id': ColumnInfo(
         attribute_type=AttributeType.COLUMN,
-        primary_key=False,
+        attribute=JTI_Company.id,
+        primary_key=True,
         foreign_key=False,
+        nullable=False,  # primary key
         readable=True,
         writable=True,
         value_type=int,
+        default=NOT_PROVIDED,  # because not nullable
+        default_factory=None,
         doc=None
-    )
-
-    generated_fields = sa_model_info(Number, types=AttributeType.ALL, exclude=())
-    expected_fields = {
-        'id': ColumnInfo(**{
-            **common_field_info,
-            **dict(
-                attribute=Number.id,
-                primary_key=True,
-                nullable=False,  # primary key
-                default=NOT_PROVIDED,  # because not nullable
-                default_factory=None,
-            ),
-        }),
-        'n': ColumnInfo(
-            attribute=Number.n,
-            nullable=True,  # nullable
-            default=None,  # because nullable
-            default_factory=None,
-            **common_field_info
-        ),
-        'nd1': ColumnInfo(
-            attribute=Number.nd1,
-            nullable=True,
-            default=100,
-            default_factory=None,
-            **common_field_info
-        ),
-        'nd2': ColumnInfo(
-            attribute=Number.nd2,
-            nullable=True,
-            default=NOT_PROVIDED,  # we don't work with callables
-            default_factory=None,
-            **common_field_info
-        ),
-        'nd3': ColumnInfo(
-            attribute=Number.nd3,
-            nullable=True,
-            default=NOT_PROVIDED,  # we don't work with expressions
-            default_factory=None,
-            **common_field_info
-        ),
-        'd1': ColumnInfo(
-            attribute=Number.d1,
-            nullable=False,
-            default=100,
-            default_factory=None,
-            **common_field_info
-        ),
-        'd2': ColumnInfo(
-            attribute=Number.d2,
-            nullable=False,
-            default=NOT_PROVIDED,  # we don't work with callables
-            default_factory=None,
-            **common_field_info
-        ),
-        'd3': ColumnInfo(
-            attribute=Number.d3,
-            nullable=False,
-            default=NOT_PROVIDED,  # we don't work with expressions
-            default_factory=None,
-            **common_field_info
-        ),
-    }
-
-    assert generated_fields == expected_fields
+    ),
+    'name': ColumnInfo(
+        attribute_type=AttributeType.COLUMN,
+        attribute=JTI_Company.name,
+        primary_key=False,
+        foreign_key=False,
+        nullable=True,
+        readable=True,
+        writable=True,
+        value_type=str,
+        default=None,
+        default_factory=None,
+        doc=None
+    ),
+    'employees': RelationshipInfo(
+        attribute_type=AttributeType.RELATIONSHIP,
+        attribute=JTI_Company.employees,
+        nullable=False,
+        readable=True,
+        writable=True,
+        value_type=_LIST_JTI_EMPLOYEE,
+        target_model=JTI_Employee,
+        uselist=True,
+        collection_class=list,
+        default=NOT_PROVIDED,
+        default_factory=list,
+        doc=None
+    ),
+}
 
 
-    # Test primary key
-    assert sa_model_primary_key_info(Number) == {'id': expected_fields['id']}
+_EXPECTED_JTI_COMPANY_FINAL_TYPES = {
+    'id': int,
+    'name': _OPT_STR,
+    'employees': _LIST_JTI_EMPLOYEE,
+}
 
 
 def test_sa_model_info_extraction__JTI_Company():
-    """ Test sa_model_info(JTI_Company) """
+    """ Test sa_model_info(JTI_Company): final values """
     generated_fields = sa_model_info(JTI_Company, types=AttributeType.ALL, exclude=())
-    expected_fields = {
-        'id': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=JTI_Company.id,
-            primary_key=True,
-            foreign_key=False,
-            nullable=False,  # primary key
-            readable=True,
-            writable=True,
-            value_type=int,
-            default=NOT_PROVIDED,  # because not nullable
-            default_factory=None,
-            doc=None
-        ),
-        'name': ColumnInfo(
-            attribute_type=AttributeType.COLUMN,
-            attribute=JTI_Company.name,
-            primary_key=False,
-            foreign_key=False,
-            nullable=True,
-            readable=True,
-            writable=True,
-            value_type=str,
-            default=None,
-            default_factory=None,
-            doc=None
-        ),
-        'employees': RelationshipInfo(
-            attribute_type=AttributeType.RELATIONSHIP,
-            attribute=JTI_Company.employees,
-            nullable=False,
-            readable=True,
-            writable=True,
-            value_type=List[JTI_Employee],
-            target_model=JTI_Employee,
-            uselist=True,
-            collection_class=list,
-            default=NOT_PROVIDED,
-            default_factory=list,
-            doc=None
-        ),
-    }
-
-    assert generated_fields == expected_fields
 
     # Compare final values
     assert {
         name: attr.final_value_type
         for name, attr in generated_fields.items()
-    } == {
-        'id': int,
-        'name': Optional[str],
-        'employees': List[JTI_Employee],
-    }
+    } == _EXPECTED_JTI_COMPANY_FINAL_TYPES
+
+
+@pytest.mark.parametrize(('Model', 'expected_fields', 'expected_pk'), [
+    # User: see test_sa_model_info_extraction__User_attribute()
+    (Article, _EXPECTED_ARTICLE_FIELDS, ('id',)),
+    (Number, _EXPECTED_NUMBER_FIELDS, ('id',)),  # test for defaults
+    (JTI_Company, _EXPECTED_JTI_COMPANY_FIELDS, ('id',)),
+], ids=['Article', 'Number', 'JTI_Company'])
+def test_sa_model_info_extraction(Model, expected_fields, expected_pk):
+    """ Test sa_model_info(Model) against the expected info """
+    generated_fields = sa_model_info(Model, types=AttributeType.ALL, exclude=())
+
+    _assert_fields_equal(generated_fields, expected_fields)
+
+    # Test primary key
+    assert sa_model_primary_key_info(Model) == {name: expected_fields[name] for name in expected_pk}
+
+
+_EXPECTED_JTI_EMPLOYEE_COMPANY_INFO = RelationshipInfo(
+    attribute_type=AttributeType.RELATIONSHIP,
+    attribute=JTI_Employee.company,
+    nullable=True,
+    readable=True,
+    writable=True,
+    value_type=JTI_Company,
+    target_model=JTI_Company,
+    uselist=False,
+    collection_class=None,
+    default=None,
+    default_factory=None,
+    doc=None
+)
 
 
 def test_sa_model_info_extraction__JTI_Employee():
-    """ Test sa_model_info(JTI_Company) """
+    """ Test sa_model_info(JTI_Employee) """
     generated_fields = sa_model_info(JTI_Employee, types=AttributeType.ALL, exclude=())
     assert set(generated_fields) == {
         'id', 'name', 'type', 'company_id', 'company',
     }
-    assert generated_fields['company'] == RelationshipInfo(
-        attribute_type=AttributeType.RELATIONSHIP,
-        attribute=JTI_Employee.company,
-        nullable=True,
-        readable=True,
-        writable=True,
-        value_type=JTI_Company,
-        target_model=JTI_Company,
-        uselist=False,
-        collection_class=None,
-        default=None,
-        default_factory=None,
-        doc=None
-    )
+    assert generated_fields['company'] == _EXPECTED_JTI_EMPLOYEE_COMPANY_INFO
 
     # Engineer is the same: inherits fields
     generated_fields = sa_model_info(JTI_Engineer, types=AttributeType.ALL, exclude=())
@@ -789,92 +841,154 @@ def test_sa_model_info_extraction__JTI_Employee():
         'engineer_name',
     }
 
+    # Inherited attributes are the subclass's own: the info can't be borrowed from the parent model
+    assert generated_fields['id'].attribute is JTI_Engineer.id
+    assert generated_fields['id'].foreign_key  # JTI: references the parent table
+    assert not sa_model_info(JTI_Employee, types=AttributeType.ALL, exclude=())['id'].foreign_key
+
+
+_EXPECTED_STI_EMPLOYEE_NAMES = frozenset({
+    'id', 'name', 'type',
+})
+
+_EXPECTED_STI_MANAGER_NAMES = frozenset({
+    'id', 'name', 'type',  # employee fields
+    # additional fields
+    'manager_data', 'company_id', 'company',
+})
 
+_EXPECTED_STI_ENGINEER_NAMES = frozenset({
+    'id', 'name', 'type',  # employee fields
+    # additional fields
+    'engineer_info',
+})
 
 
 def test_sa_model_info_extraction__STI_Employee():
     """ Test sa_model_info(STI_Employee) """
-    assert set(sa_model_info(STI_Employee, types=AttributeType.ALL, exclude=())) == {
-        'id', 'name', 'type',
-    }
+    assert set(sa_model_info_keys(STI_Employee, types=AttributeType.ALL)) == _EXPECTED_STI_EMPLOYEE_NAMES
 
-    assert set(sa_model_info(STI_Manager, types=AttributeType.ALL, exclude=())) == {
-        'id', 'name', 'type',  # employee fields
-        # additional fields
-        'manager_data', 'company_id', 'company',
-    }
+    assert set(sa_model_info_keys(STI_Manager, types=AttributeType.ALL)) == _EXPECTED_STI_MANAGER_NAMES
 
-    assert set(sa_model_info(STI_Engineer, types=AttributeType.ALL, exclude=())) == {
-        'id', 'name', 'type',  # employee fields
-        # additional fields
-        'engineer_info',
-    }
+    assert set(sa_model_info_keys(STI_Engineer, types=AttributeType.ALL)) == _EXPECTED_STI_ENGINEER_NAMES
 
+    # Same names, same order as sa_model_info()
+    assert sa_model_info_keys(STI_Manager, types=AttributeType.ALL, exclude=('company',)) == \
+           tuple(sa_model_info(STI_Manager, types=AttributeType.ALL, exclude=('company',)))
 
 
-def test_sa_model_info_arguments():
-    """ Test sa_model_info() targeting arguments """
+_EXPECTED_USER_COLUMNS = frozenset({
+    '_ignored', 'annotated_int', 'int', 'enum', 'optional', 'required', 'default', 'documented', 'json_attr',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.COLUMN)) == {
-        '_ignored', 'annotated_int', 'int', 'enum', 'optional', 'required', 'default', 'documented', 'json_attr',
-    }
+_EXPECTED_USER_COLUMNS_EXCLUDING = frozenset({
+    '_ignored', 'annotated_int',                 'optional', 'required', 'default', 'documented',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.COLUMN, exclude=('int', 'enum', 'json_attr'))) == {
-        '_ignored', 'annotated_int',                 'optional', 'required', 'default', 'documented',
-    }
+_EXPECTED_USER_PROPERTIES_R = frozenset({
+    # only readable
+    'property_without_type', 'property_typed', 'property_documented', 'property_nullable',
+    'property_writable',  # both readable and writable
+})
 
-    assert set(sa_model_info(User, types=AttributeType.PROPERTY_R)) == {
-        # only readable
-        'property_without_type', 'property_typed', 'property_documented', 'property_nullable',
-        'property_writable',  # both readable and writable
-    }
+_EXPECTED_USER_PROPERTIES_W = frozenset({
+    # only writable
+    'property_writable',  # fine selection
+})
 
-    assert set(sa_model_info(User, types=AttributeType.PROPERTY_W)) == {
-        # only writable
-        'property_writable',  # fine selection
-    }
+_EXPECTED_USER_PROPERTIES_RW = frozenset({
+    # both readable and writable
+    'property_without_type', 'property_typed', 'property_documented', 'property_nullable', 'property_writable',
+    'property_writable',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.PROPERTY_RW)) == {
-        # both readable and writable
-        'property_without_type', 'property_typed', 'property_documented', 'property_nullable', 'property_writable',
-        'property_writable',
-    }
+_EXPECTED_USER_HYBRID_PROPERTIES_R = frozenset({
+    'hybrid_property_typed', 'hybrid_property_writable',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.HYBRID_PROPERTY_R)) == {
-        'hybrid_property_typed', 'hybrid_property_writable',
-    }
+_EXPECTED_USER_HYBRID_PROPERTIES_W = frozenset({
+    'hybrid_property_writable',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.HYBRID_PROPERTY_W)) == {
-        'hybrid_property_writable',
-    }
+_EXPECTED_USER_HYBRID_PROPERTIES_RW = frozenset({
+    'hybrid_property_typed', 'hybrid_property_writable',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.HYBRID_PROPERTY_RW)) == {
-        'hybrid_property_typed', 'hybrid_property_writable',
-    }
+_EXPECTED_USER_RELATIONSHIPS = frozenset({
+    'articles_list', 'articles_set', 'articles_dict_attr', 'articles_dict_keyfun',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.RELATIONSHIP)) == {
-        'articles_list', 'articles_set', 'articles_dict_attr', 'articles_dict_keyfun',
-    }
+_EXPECTED_USER_DYNAMIC_LOADERS = frozenset({
+    'articles_q',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.DYNAMIC_LOADER)) == {
-        'articles_q',
-    }
+_EXPECTED_USER_ASSOCIATION_PROXIES = frozenset({
+    'article_titles', 'article_authors',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.ASSOCIATION_PROXY)) == {
-        'article_titles', 'article_authors',
-    }
+_EXPECTED_USER_COMPOSITES = frozenset({
+    'point', 'synonym',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.COMPOSITE)) == {
-        'point', 'synonym',
-    }
+_EXPECTED_USER_EXPRESSIONS = frozenset({
+    'expression',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.EXPRESSION)) == {
-        'expression',
-    }
+_EXPECTED_USER_HYBRID_METHODS = frozenset({
+    'hybrid_method_attr',
+})
 
-    assert set(sa_model_info(User, types=AttributeType.HYBRID_METHOD)) == {
-        'hybrid_method_attr',
-    }
+
+_TYPE_EXPECTATIONS = [
+    (AttributeType.COLUMN, _EXPECTED_USER_COLUMNS),
+    (AttributeType.PROPERTY_R, _EXPECTED_USER_PROPERTIES_R),
+    (AttributeType.PROPERTY_W, _EXPECTED_USER_PROPERTIES_W),
+    (AttributeType.PROPERTY_RW, _EXPECTED_USER_PROPERTIES_RW),
+    (AttributeType.HYBRID_PROPERTY_R, _EXPECTED_USER_HYBRID_PROPERTIES_R),
+    (AttributeType.HYBRID_PROPERTY_W, _EXPECTED_USER_HYBRID_PROPERTIES_W),
+    (AttributeType.HYBRID_PROPERTY_RW, _EXPECTED_USER_HYBRID_PROPERTIES_RW),
+    (AttributeType.RELATIONSHIP, _EXPECTED_USER_RELATIONSHIPS),
+    (AttributeType.DYNAMIC_LOADER, _EXPECTED_USER_DYNAMIC_LOADERS),
+    (AttributeType.ASSOCIATION_PROXY, _EXPECTED_USER_ASSOCIATION_PROXIES),
+    (AttributeType.COMPOSITE, _EXPECTED_USER_COMPOSITES),
+    (AttributeType.EXPRESSION, _EXPECTED_USER_EXPRESSIONS),
+    (AttributeType.HYBRID_METHOD, _EXPECTED_USER_HYBRID_METHODS),
+]
+
+
+def test_sa_model_info_arguments():
+    """ Test sa_model_info() targeting arguments """
+    # Every type
+    for types, expected_names in _TYPE_EXPECTATIONS:
+        assert set(sa_model_info(User, types=types)) == expected_names, types
+
+    # Exclude
+    assert set(sa_model_info(User, types=AttributeType.COLUMN, exclude=('int', 'enum', 'json_attr'))) == _EXPECTED_USER_COLUMNS_EXCLUDING
+
+
+def test_sa_model_info_cached():
+    """ Test that repeated sa_model_info() calls reuse the result instead of inspecting the model again """
+    # Name-list excludes are cached regardless of the container type: info objects are shared
+    a = sa_model_info(User, types=AttributeType.COLUMN, exclude=('int',))
+    b = sa_model_info(User, types=AttributeType.COLUMN, exclude={'int'})
+    assert a == b
+    assert all(a[name] is b[name] for name in a)
+
+    # ... but every caller gets a dict of its own
+    assert type(a) is dict
+    assert a is not b
+    del a['required']
+    assert 'required' in sa_model_info(User, types=AttributeType.COLUMN, exclude=('int',))
+
+    # Individual attributes are cached as well
+    assert sa_attribute_info(User, 'int') is sa_attribute_info(User, 'int')
 
 
+def _assert_fields_equal(generated_fields: Mapping[str, Any], expected_fields: Mapping[str, Any]):
+    """ Compare two dicts of attribute info: keys first, then key by key, naming the offending key """
+    missing = expected_fields.keys() - generated_fields.keys()
+    extra = generated_fields.keys() - expected_fields.keys()
+    assert not missing and not extra, (missing, extra)
 
+    for name in expected_fields:
+        assert generated_fields[name] == expected_fields[name], name
@@ -7,17 +7,42 @@ from sqlalchemy.ext.declarative import declarative_base
 
 from sa2schema import AttributeType
 from sa2schema.to.pydantic import Models
-from sa2schema.to.pydantic.stubgen import stubs_for_pydantic
-from sa2schema.stubgen import stubs_for_sa_models
 
 
 PYTHON_LT_39 = sys.version_info < (3, 9)
 
+# Every test here is skipped below Python 3.9: don't even import the stub generators
+if not PYTHON_LT_39:
+    from sa2schema.to.pydantic.stubgen import stubs_for_pydantic
+    from sa2schema.stubgen import stubs_for_sa_models
+else:
+    stubs_for_pydantic = stubs_for_sa_models = None
+
+
+@pytest.fixture(scope='module')
+def all_models() -> Models:
+    """ Models() for User & Article: all attribute types """
+    models = Models(__name__, types=AttributeType.ALL, naming='{model}Model')
+    models.sa_model(User)
+    models.sa_model(Article)
+    return models
+
+
+@pytest.fixture(scope='module')
+def sa_stub_ast() -> ast.Module:
+    """ Stubs for the SqlAlchemy models """
+    return stubs_for_sa_models([User, Article])
+
+
+@pytest.fixture(scope='module')
+def pydantic_stub_ast(all_models: Models) -> ast.Module:
+    """ Stubs for the Pydantic models """
+    return stubs_for_pydantic(all_models)
+
 
 @pytest.mark.skipif(PYTHON_LT_39, reason='ast.unparse() only available since Python 3.9')
-def test_stubgen_sqlalchemy():
-    py = ast.unparse(stubs_for_sa_models([User, Article]))
-    assert py == '''
+def test_stubgen_sqlalchemy(sa_stub_ast: ast.Module):
+    assert_stub_equal(sa_stub_ast, '''
 from __future__ import annotations
 import builtins, datetime, tests.test_stubgen, typing
 NoneType = type(None)
@@ -34,19 +59,12 @@ class Article:
     user_id: typing.Union[int, NoneType] = ...
     ctime: typing.Union[datetime.datetime, NoneType] = ...
     user: typing.Union[tests.test_stubgen.User, NoneType] = ...
-    '''.strip()
+    ''')
 
 
 @pytest.mark.skipif(PYTHON_LT_39, reason='ast.unparse() only available since Python 3.9')
-def test_stubgen_pydantic():
-    # Prepare models
-    models = Models(__name__, types=AttributeType.ALL, naming='{model}Model')
-    models.sa_model(User)
-    models.sa_model(Article)
-
-    # Convert
-    py = ast.unparse(stubs_for_pydantic(models))
-    assert py == '''
+def test_stubgen_pydantic(pydantic_stub_ast: ast.Module):
+    assert_stub_equal(pydantic_stub_ast, '''
 from __future__ import annotations
 import pydantic
 import builtins, datetime, typing
@@ -63,8 +81,18 @@ class ArticleModel(pydantic.main.BaseModel):
     id: int = ...
     user_id: typing.Union[int, NoneType] = ...
     ctime: typing.Union[datetime.datetime, NoneType] = ...
-    user: typing.Union[UserModel, NoneType] = ...    
-'''.strip()
+    user: typing.Union[UserModel, NoneType] = ...
+''')
+
+
+def assert_stub_equal(stub: ast.Module, expected: str):
+    """ Compare a generated stub to the expected source code. Formatting is ignored. """
+    assert ast.unparse(stub) == _normalized_source(expected)
+
+
+def _normalized_source(source: str) -> str:
+    """ Reformat source code the way ast.unparse() prints it """
+    return ast.unparse(ast.parse(source))
 
 
 
@@ -87,4 +115,3 @@ class Article(Base):
     ctime = sa.Column(sa.DateTime)
 
     user = sa.orm.relationship(User, back_populates='articles')
-